@@ -1,20 +1,60 @@
 import typer
 from typing_extensions import Annotated
 from rich.progress import track
-from typing import List
+from typing import List, Iterator
 from pathlib import Path
 
-from pageplus.io.logger import logging
+from pageplus.io.logger import logging, log_path, init_worker_logging
 from pageplus.io.utils import collect_xml_files
-from pageplus.models.page import Page
 from pageplus.analytics.counter import PageCounter
 
 app = typer.Typer()
 
+def _count_page(xml_file: Path) -> PageCounter:
+    """
+    Collects the statistics of a single PAGE XML file.
+
+    Defined at module level, so it can be dispatched to worker processes.
+
+    Args:
+        xml_file: Path to the PAGE XML file.
+
+    Returns:
+        A PageCounter holding the counts of the file.
+    """
+    from pageplus.models.page import Page
+
+    # Initialize Page object and PageCounter for the current file
+    page = Page(xml_file)
+    page_counter = PageCounter()
+
+    # Collect statistics for the current page
+    page_counter.textregions += page.counter(level='textregions')
+    page_counter.tableregions += page.counter(level='tableregions')
+    page_counter.textlines += page.counter(level='textlines')
+    page_counter.words += page.counter(level='words')
+    page_counter.glyphs += page.counter(level='glyphs')
+    return page_counter
+
+def _collect_page_counters(xml_files: List[Path], jobs: int = 1) -> Iterator[PageCounter]:
+    """
+    Yields the PageCounter of every file in input order, using a process pool if jobs > 1.
+    """
+    if jobs == 1:
+        yield from map(_count_page, xml_files)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    # The workers log to the file of this run, not to one named after their own start time
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker_logging,
+                             initargs=(log_path,)) as executor:
+        yield from executor.map(_count_page, xml_files)
+
 @app.command()
 def statistics(
     inputs: Annotated[List[Path],
-    typer.Argument(exists=True, help="Paths to the XML files to be checked.")]
+    typer.Argument(exists=True, help="Paths to the XML files to be checked.")],
+    jobs: Annotated[int, typer.Option(help="Number of worker processes to collect the statistics with.", min=1)] = 1
 ):
     """
     Statistics about PAGE XML files.
@@ -24,6 +64,7 @@ def statistics(
 
     Args:
         inputs: An iterator of Path objects pointing to the XML files to be checked.
+        jobs: Number of worker processes, the files are processed independently.
 
     Raises:
         FileNotFoundError: If no XML files are found in the given input paths.
@@ -36,20 +77,12 @@ def statistics(
     # Create statistics for all pages
     pagescounter = PageCounter()
 
-    # Loop through all XML files
-    for xml_file in track(xml_files, description="Collecting statistics.."):
+    # Loop through the statistics of all XML files
+    page_counters = zip(xml_files, _collect_page_counters(xml_files, jobs=jobs))
+    for xml_file, page_counter in track(page_counters, total=len(xml_files),
+                                        description="Collecting statistics.."):
         filename = xml_file.name
-        logging.info('Processing file: ' + filename)
-        # Initialize Page object and PageCounter for the current file
-        page = Page(xml_file)
-        page_counter = PageCounter()
-
-        # Collect statistics for the current page
-        page_counter.textregions += page.counter(level='textregions')
-        page_counter.tableregions += page.counter(level='tableregions')
-        page_counter.textlines += page.counter(level='textlines')
-        page_counter.words += page.counter(level='words')
-        page_counter.glyphs += page.counter(level='glyphs')
+        logging.info('Collected statistics of file: ' + filename)
 
         # Log statistics for the current page
         page_counter.statistics(pre_text=f"Statistics for {filename}")
@@ -4,13 +4,11 @@ from enum import Enum
 import csv
 
 from rich.progress import track
-from shapely import LineString
 import typer
 from typing_extensions import Annotated
 
 from pageplus.io.logger import logging
 from pageplus.io.utils import collect_xml_files, determine_output_path
-from pageplus.models.page import Page
 
 app = typer.Typer()
 
@@ -41,18 +39,24 @@ def fulltext(
         ro: If True, use the region reading order instead of the Textline document order
         ro_mode: Set mode how to calculate the region reading order
     """
+    from pageplus.models.page import Page
+
     # Collect XML files from the input paths
     xml_files = collect_xml_files(map(Path, inputs))
     if not xml_files:
         raise FileNotFoundError('No XML files found in the input directory.')
+    # A given output directory is shared by all files, create it only once
+    if outputdir is not None:
+        outputdir.mkdir(parents=True, exist_ok=True)
     for xml_file in track(xml_files, description="Extracting fulltext.." ):
         filename = xml_file.stem  # Extracts the filename without the extension
         logging.info(f'Processing file: {filename}')
 
         # Determine the output file path
         text_output_path = Path(f"{xml_file.parent}/Fulltext/{xml_file.with_suffix('.txt').name}") if outputdir is None \
-    else outputdir / filename
-        text_output_path.parent.mkdir(parents=True, exist_ok=True)
+    else outputdir / xml_file.with_suffix('.txt').name
+        if outputdir is None:
+            text_output_path.parent.mkdir(parents=True, exist_ok=True)
         logging.info(f'Writing text file to: {text_output_path}')
 
         # Extract and write full text to the output file
@@ -81,11 +85,17 @@ def dsv(
         dehyphenate: If True, dehyphenates the text lines in the output.
         outputdir: Path to the output directory where the DSV files will be saved.
     """
+    from shapely import LineString
+    from pageplus.models.page import Page
+
     # You
     xml_files = collect_xml_files(map(Path, inputs))
     # raise error if no xml files are found
     if not xml_files:
         raise FileNotFoundError('No xml files found in input directory')
+    # A given output directory is shared by all files, create it only once
+    if outputdir is not None:
+        outputdir.mkdir(parents=True, exist_ok=True)
 
     # loop through all xml files
     for xml_file in track(xml_files, description="Exporting data to a DSV file.."):
@@ -99,9 +109,10 @@ def dsv(
                       'area': [], 'width': [], 'length': []}
         for rid, textregion in enumerate(page.regions.textregions):
             for line in textregion.textlines:
-                if line.get_text is None: continue
+                text = line.get_text()
+                if text is None: continue
                 line_infos['id'].append(line.get_id())
-                line_infos['text'].append(line.get_text())
+                line_infos['text'].append(text)
                 line_infos['region'].append(rid)
                 baseline_coords = line.get_baseline_coordinates(returntype='linestring')
                 if baseline_coords is not None:
@@ -130,8 +141,9 @@ def dsv(
 
         # Write to file
         filepath = Path(f"{xml_file.parent}/TSV/{xml_file.with_suffix('.tsv').name}") if outputdir is None \
-            else outputdir / filename
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+            else outputdir / xml_file.with_suffix('.tsv').name
+        if outputdir is None:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
         logging.info('Wrote separated value file to output directory: ' + str(filepath))
         with open(filepath, 'w') as tsvfile:
             #csv writer to write in tsv file
@@ -6,7 +6,6 @@ from pathlib import Path
 
 from pageplus.io.logger import logging
 from pageplus.io.utils import collect_xml_files, determine_output_path
-from pageplus.models.page import Page
 
 app = typer.Typer()
 
@@ -24,6 +23,8 @@ def repair(
         dry_run: If True, the function will not write any files.
         outputdir: The directory where the repaired XML files will be saved.
     """
+    from pageplus.models.page import Page
+
     xml_files = collect_xml_files(map(Path, inputs))
 
     if not xml_files:
@@ -56,7 +57,7 @@ def repair(
             for tablecell in tableregion.tablecells:
                 repair_region(tablecell)
 
-    for xml_file in track(sorted(xml_files), "Repairing files.."):
+    for xml_file in track(xml_files, "Repairing files.."):
         filename = xml_file.name
         logging.info(f'Repairing file: {filename}')
 
@@ -83,6 +84,8 @@ def delete_text(
         level: The level at which text elements will be deleted ('region', 'word', or 'line').
         outputdir: The directory where the modified XML files will be saved.
     """
+    from pageplus.models.page import Page
+
     xml_files = collect_xml_files(map(Path, inputs))
 
     if not xml_files:
@@ -112,6 +115,8 @@ def delete_textlines(
         inputs: Paths to the PAGE XML files to be processed.
         outputdir: The directory where the modified XML files will be saved.
     """
+    from pageplus.models.page import Page
+
     xml_files = collect_xml_files(map(Path, inputs))
 
     if not xml_files:
@@ -150,7 +155,13 @@ def extend_lines(
         cut_overlaps: Fit the extended target into the parent region.
         dry_run: If set, no files will be written.
     """
+    from pageplus.models.page import Page
+
     xml_files = collect_xml_files(map(Path, inputs))
+
+    if not xml_files:
+        raise FileNotFoundError('No XML files found in the input paths.')
+
     def process_overlapping_lines(textregion, idx, line):
         """
         Processes overlapping lines in a text region.
@@ -160,8 +171,6 @@ def extend_lines(
                                                                                    line.get_coordinates('linearring'))
         line.update_coordinates(line_coords)
         predecessor_line.update_coordinates(predecessor_line_coords)
-        if not xml_files:
-            raise FileNotFoundError('No XML files found in the input paths.')
 
     for xml_file in track(xml_files, description="Extending Textlines.."):
         filename = xml_file.name
@@ -194,6 +203,8 @@ outputdir: Annotated[Optional[Path], typer.Option(help="Filename of the output d
         inputs: Paths to the PAGE XML files to be processed.
         outputdir: The directory where the modified XML files will be saved.
     """
+    from pageplus.models.page import Page
+
     xml_files = collect_xml_files(map(Path, inputs))
 
     if not xml_files:
@@ -235,6 +246,8 @@ def sort_and_merge(
         merge_lines_gap_y: The maximum vertical gap in pixels to consider for merging lines.
         outputdir: The directory where the modified XML files will be saved.
     """
+    from pageplus.models.page import Page
+
     outputdir = Path(outputdir) if outputdir else None
     xml_files = collect_xml_files(map(Path, inputs))
 
@@ -6,7 +6,6 @@ from pathlib import Path
 
 from pageplus.io.logger import logging
 from pageplus.io.utils import collect_xml_files
-from pageplus.models.page import Page
 
 app = typer.Typer()
 
@@ -26,6 +25,8 @@ def validate_all(
     Raises:
         FileNotFoundError: If no XML files are found in the given input paths.
     """
+    from pageplus.models.page import Page
+
     xml_files = collect_xml_files(map(Path, inputs))
 
     if not xml_files:
@@ -53,7 +54,7 @@ def validate_all(
             logging.info(f"{region.get_id()}: Region contains no text.")
 
 
-    for xml_file in track(sorted(xml_files), description="Validating files..."):
+    for xml_file in track(xml_files, description="Validating files..."):
         filename = xml_file.name
         logging.info('Validating file: ' + filename)
 
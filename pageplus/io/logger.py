@@ -1,7 +1,20 @@
 from datetime import datetime
 import logging
+import sys
 from pathlib import Path
 
 log_path = Path(__file__).parents[2].joinpath(datetime.now().strftime('logs/PagePlus_%H_%M_%d_%m_%Y.log'))
-logging.basicConfig(level=logging.DEBUG, handlers=[logging.FileHandler(log_path, mode='w'),
-                                                   logging.StreamHandler()])
+# Spawned worker processes import multiprocessing before this module. They log to the file of
+# their parent run (see init_worker_logging) instead of creating or truncating one of their own.
+_multiprocessing = sys.modules.get('multiprocessing')
+if _multiprocessing is None or _multiprocessing.parent_process() is None:
+    logging.basicConfig(level=logging.DEBUG, handlers=[logging.FileHandler(log_path, mode='w'),
+                                                       logging.StreamHandler()])
+
+
+def init_worker_logging(parent_log_path: Path) -> None:
+    """
+    Initializer for worker processes, which appends their messages to the log file of the parent run.
+    """
+    logging.basicConfig(level=logging.DEBUG, handlers=[logging.FileHandler(parent_log_path, mode='a'),
+                                                       logging.StreamHandler()], force=True)
@@ -2,6 +2,9 @@ import lxml.etree as ET
 from pathlib import Path
 from typing import Tuple
 
+# Compiled once and reused for every parsed file
+NAMESPACE_URI_XPATH = ET.XPath('namespace-uri(.)')
+
 def parse_xml(filepath: Path = '') -> Tuple[ET.Element, ET._ElementTree, str]:
     """"
     Parses an XML file and returns its root element, the ElementTree object, and the XML namespace.
@@ -16,6 +19,6 @@ def parse_xml(filepath: Path = '') -> Tuple[ET.Element, ET._ElementTree, str]:
     tree = ET.parse(str(filepath.absolute()))
     root = tree.getroot()
     # Extracting namespace from the root tag
-    namespace = tree.xpath('namespace-uri(.)')
+    namespace = NAMESPACE_URI_XPATH(tree)
     return tree, root, namespace
 
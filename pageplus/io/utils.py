@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Tuple, Iterator, List
 
@@ -22,9 +23,31 @@ def collect_xml_files(inputpaths: Iterator[Path], exclude: Tuple[str, ...] = ('m
         if inputpath.is_file() and inputpath.suffix == '.xml' and inputpath.name not in exclude and is_page_xml(inputpath):
             xml_files.append(inputpath)
         elif inputpath.is_dir():
-            xml_files.extend([xml_file for xml_file in inputpath.rglob('*.xml') if xml_file.name not in exclude and is_page_xml(xml_file)])
+            xml_files.extend([xml_file for xml_file in _scan_xml_files(inputpath) if xml_file.name not in exclude and is_page_xml(xml_file)])
     return sorted(xml_files)
 
+def _scan_xml_files(directory: Path) -> Iterator[Path]:
+    """
+    Recursively yields the XML files below a directory.
+
+    Uses os.scandir, so the file type is read from the cached directory entries
+    instead of an extra stat call per file as with Path.rglob. Like rglob, symlinked
+    directories are not followed, unreadable directories are skipped and the suffix
+    is matched case-insensitively on Windows.
+    """
+    directories = [directory]
+    while directories:
+        try:
+            entries = os.scandir(directories.pop())
+        except PermissionError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(Path(entry.path))
+                elif entry.is_file() and os.path.normcase(entry.name).endswith('.xml'):
+                    yield Path(entry.path)
+
 def is_page_xml(file_path: Path) -> bool:
     """
     Check if file is a page xml file
@@ -12,6 +12,11 @@ from shapely.ops import nearest_points, unary_union, split
 
 from pageplus.io.logger import logging
 
+# Separators of the x,y values in a PAGE XML points attribute
+COORDS_SEPARATOR = re.compile(r',|\s')
+# Supported return types of CoordElement.get_coordinates
+COORDS_RETURNTYPES = frozenset({"string", "tuple", "points", "linearring", "mrr", "polygon"})
+
 
 @dataclass
 class CoordElement:
@@ -34,8 +39,7 @@ class CoordElement:
         Retrieves coordinates in various formats based on the 'returntype' parameter.
         Supported return types are 'string', 'tuple', 'points', 'linearring', 'mrr', 'polygon'.
         """
-        valid_types = ["string", "tuple", "points", "linearring", "mrr", "polygon"]
-        if returntype not in valid_types:
+        if returntype not in COORDS_RETURNTYPES:
             return None
 
         coords = self.xml_element.find(f"{{{self.ns}}}Coords")
@@ -93,7 +97,7 @@ class CoordElement:
         """
         Converts a string of coordinates to a list of coordinate tuples (x, y).
         """
-        coordstr_vals = re.split(r',|\s', coordstr)
+        coordstr_vals = COORDS_SEPARATOR.split(coordstr)
         coordvals = list(map(int, map(float, coordstr_vals)))
         return list(zip(coordvals[0::2], coordvals[1::2]))
 
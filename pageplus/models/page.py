@@ -12,6 +12,11 @@ from pageplus.models.text_elements import TextRegion
 from pageplus.io.parser import parse_xml
 from pageplus.io.writer import write_xml
 
+# Hyphens used for dehyphenation, see https://ocr-d.de/en/gt-guidelines/trans/trSilbentrennung.html
+HYPHENS = '-⹀⸗'
+# Supported return types of Page.page_coords
+PAGE_COORDS_RETURNTYPES = frozenset({"string", "tuples", "points", "polygon", "linearring"})
+
 
 @dataclass
 class Regions:
@@ -35,33 +40,32 @@ class Page:
             self.tree, self.root, self.ns = self._open_xml(self.filename)
 
         text_region_xpath = f"{{{self.ns}}}TextRegion"
-        self.regions.textregions = [TextRegion(ele, self.ns, parent=self) \
-                                    for ele in self.root.iter(text_region_xpath)]
-
         table_region_xpath = f"{{{self.ns}}}TableRegion"
-        self.regions.tableregions = [TableRegion(ele, self.ns, parent=self) \
-                                     for ele in self.root.iter(table_region_xpath)]
+        self.regions.textregions, self.regions.tableregions = [], []
+        # Collect both region types in a single pass over the tree
+        for ele in self.root.iter(text_region_xpath, table_region_xpath):
+            if ele.tag == text_region_xpath:
+                self.regions.textregions.append(TextRegion(ele, self.ns, parent=self))
+            else:
+                self.regions.tableregions.append(TableRegion(ele, self.ns, parent=self))
 
     def get_region_reading_order_ids(self, mode: str = 'auto'):
         ro_ids = []
         if mode in ['auto', 'reading_order']:
             reading_order = self.tree.find(f".//{{{self.ns}}}ReadingOrder")
             if reading_order is not None:
-                # Process each group in the reading order
-                for group in reading_order.iterfind(f".//{{{self.ns}}}*"):
-                    # Check if the group is an 'OrderedGroup'
-                    if ET.QName(group.tag).localname == 'OrderedGroup':
-                        # Find all 'RegionRefIndexed' elements and sort them by index
-                        ro_ids = [ref.attrib['regionRef'] for ref in
-                                  sorted(group.findall(f"./{{{self.ns}}}RegionRefIndexed"),
-                                         key=lambda r: int(r.attrib['index']))]
+                # Process each 'OrderedGroup' in the reading order
+                for group in reading_order.iter(f"{{{self.ns}}}OrderedGroup"):
+                    # Find all 'RegionRefIndexed' elements and sort them by index
+                    ro_ids = [ref.attrib['regionRef'] for ref in
+                              sorted(group.findall(f"./{{{self.ns}}}RegionRefIndexed"),
+                                     key=lambda r: int(r.attrib['index']))]
         if mode == 'document' or (not ro_ids and mode == 'auto'):
-            for region in self.root.findall(f".//{{{self.ns}}}*"):
-                region_type = ET.QName(region.tag).localname
-                if region_type in ['TableRegion', 'TextRegion']:
-                    region_id = region.attrib.get('id', None)  # Get the ID attribute
-                    if region_id:
-                        ro_ids.append(region_id)
+            # Let lxml select the table and text regions in document order
+            for region in self.root.iter(f"{{{self.ns}}}TableRegion", f"{{{self.ns}}}TextRegion"):
+                region_id = region.attrib.get('id', None)  # Get the ID attribute
+                if region_id:
+                    ro_ids.append(region_id)
         # Return the collected text from regions
         return ro_ids
 
@@ -70,9 +74,9 @@ class Page:
         Counts elements at different levels in the page.
         """
         if level in ['glyphs', 'words', 'textlines']:
-            return sum([tr.counter(level=level) for tr in self.regions.textregions] +
-                       [tc.counter(level=level) for tableregion in self.regions.tableregions \
-                        for tc in tableregion.tablecells])
+            return sum(tr.counter(level=level) for tr in self.regions.textregions) + \
+                   sum(tc.counter(level=level) for tableregion in self.regions.tableregions
+                       for tc in tableregion.tablecells)
 
         if level == 'tablecells':
             return sum(len(tableregion.tablecells) for tableregion in self.regions.tableregions)
@@ -96,11 +100,6 @@ class Page:
         Saves the modified XML object into a PAGE XML file.
         """
         write_xml(self, filepath)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        self.tree.write(str(filepath.absolute()),
-                        xml_declaration=True,
-                        standalone=True,
-                        encoding='utf-8')
 
     @staticmethod
     def dehyphe(lines: list) -> list:
@@ -109,7 +108,6 @@ class Page:
         The hyphens are taken from the OCR-D guidelines for hyphenation:
         https://ocr-d.de/en/gt-guidelines/trans/trSilbentrennung.html.
         """
-        hyphens = ['-', '-', '⹀', '⸗']
         if not lines:
             return []
 
@@ -118,14 +116,14 @@ class Page:
 
         for i in range(len(lines)):
             current_line = lines[i]
-            if i < len(lines) - 1 and current_line and current_line[-1] in hyphens:
+            if i < len(lines) - 1 and current_line and current_line[-1] in HYPHENS:
                 next_line = lines[i + 1]
                 first_word_next_line = next_line.split(' ', 1)[0]
                 if first_word_next_line:
                     if first_word_next_line[0].isupper():
                         dehyphenated_lines.append(current_line)
                     else:
-                        dehyphenated_lines.append(current_line.rstrip(''.join(hyphens)) + first_word_next_line)
+                        dehyphenated_lines.append(current_line.rstrip(HYPHENS) + first_word_next_line)
                     lines[i + 1] = next_line[len(first_word_next_line):].lstrip()
                 else:
                     dehyphenated_lines.append(current_line)
@@ -140,14 +138,23 @@ class Page:
         Extracts the full text from the PAGE XML file.
         """
         fulltext = []
+        # Bind the namespaced paths once instead of formatting them for every region and line
+        textline_path = f".//{{{self.ns}}}TextLine"
+        unicode_path = f".//{{{self.ns}}}Unicode"
         if reading_order:
+            # Lookup table for the elements by id, built in a single pass instead of searching the tree per region
+            elements_by_id = {}
+            for element in self.root.iter(ET.Element):
+                elements_by_id.setdefault(element.get('id'), element)
             for ro_ids in self.get_region_reading_order_ids():
-                region = self.root.find(f'.//*[@id="{ro_ids}"]')
-                fulltext = [unicode_ele.text for textline in region.iterfind(f".//{{{self.ns}}}TextLine")
-                    for unicode_ele in textline.iterfind(f'.//{{{self.ns}}}Unicode') if unicode_ele.text]
+                region = elements_by_id.get(ro_ids)
+                if region is None:
+                    continue
+                fulltext.extend([unicode_ele.text for textline in region.iterfind(textline_path)
+                    for unicode_ele in textline.iterfind(unicode_path) if unicode_ele.text])
         else:
-            fulltext = [unicode_ele.text for textline in self.root.iterfind(f'.//{{{self.ns}}}TextLine')
-                    for unicode_ele in textline.iterfind(f'.//{{{self.ns}}}Unicode') if unicode_ele.text]
+            fulltext = [unicode_ele.text for textline in self.root.iterfind(textline_path)
+                    for unicode_ele in textline.iterfind(unicode_path) if unicode_ele.text]
 
         if dehyphenate and fulltext:
             fulltext = self.dehyphe(fulltext)
@@ -158,11 +165,11 @@ class Page:
         """
         Returns the coordinates of the page in various formats.
         """
-        valid_returntypes = ["string", "tuples", "points", "polygon", "linearring"]
-        if returntype not in valid_returntypes:
+        if returntype not in PAGE_COORDS_RETURNTYPES:
             return None
 
-        coord_tuples = [(0, 0), (self.page_size()[0], 0), self.page_size(), (0, self.page_size()[1])]
+        width, height = self.page_size()
+        coord_tuples = [(0, 0), (width, 0), (width, height), (0, height)]
 
         if returntype == "string":
             return " ".join(f"{x},{y}" for x, y in coord_tuples)
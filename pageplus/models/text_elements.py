@@ -15,6 +15,11 @@ from shapely.ops import nearest_points, unary_union
 from pageplus.io.logger import logging
 from pageplus.models.basic_elements import Region, CoordElement
 
+# Supported return types of Textline.get_baseline_coordinates
+BASELINE_RETURNTYPES = frozenset({"string", "tuple", "points", "linestring"})
+# Intersection types which are handled directly by nearest_points
+NEAREST_POINT_GEOM_TYPES = frozenset({'Point', 'MultiPoint', 'LineString'})
+
 
 @dataclass
 class TextRegion(Region):
@@ -33,12 +38,15 @@ class TextRegion(Region):
 
         if level == "textlines":
             return len(self.textlines)
-        if level == "words":
-            return sum(len(line.get_text().split()) for line in self.textlines if not line.is_text_empty())
-        if level == "glyphs":
-            return sum(len(line.get_text()) for line in self.textlines if not line.is_text_empty())
+        if level not in ("words", "glyphs"):
+            return 0
 
-        return 0
+        # Extract the text of each line only once and skip empty lines
+        texts = [text for text in (line.get_text() for line in self.textlines)
+                 if text is not None and text.strip() != ""]
+        if level == "words":
+            return sum(len(text.split()) for text in texts)
+        return sum(len(text) for text in texts)
 
     def delete_textlines(self, idx_list: list):
         """
@@ -176,9 +184,11 @@ class TextRegion(Region):
         """
         Merges the polygons and baselines of two lines.
         """
-        widths = [LineString([c1, c2]).length for line in self.textlines[line_index - 1:line_index + 1]
-                  for c1, c2 in zip(line.get_coordinates(returntype='polygon').minimum_rotated_rectangle.exterior.coords[:-1],
-                                    line.get_coordinates(returntype='polygon').minimum_rotated_rectangle.exterior.coords[1:])]
+        widths = []
+        for line in self.textlines[line_index - 1:line_index + 1]:
+            # Parse the coordinates and compute the rectangle only once per line
+            mrr_coords = line.get_coordinates(returntype='mrr').exterior.coords
+            widths.extend(LineString([c1, c2]).length for c1, c2 in zip(mrr_coords[:-1], mrr_coords[1:]))
         mean_width = np.median(widths)
         polygon_to_polygon_bridge = self._calculate_bridge_region(previous_baseline,
                                                                   self.textlines[line_index - 1].get_coordinates('tuple'),
@@ -272,8 +282,7 @@ class Textline(CoordElement):
         Retrieves the baseline coordinates in various formats based on the 'returntype' parameter.
         Supported return types are 'string', 'tuple', 'points', 'linestring'.
         """
-        valid_returntypes = ["string", "tuple", "points", "linestring"]
-        if returntype not in valid_returntypes:
+        if returntype not in BASELINE_RETURNTYPES:
             return None
         baseline = self.xml_element.find(f'{{{self.ns}}}Baseline')
         if baseline is not None:
@@ -404,8 +413,7 @@ class Textline(CoordElement):
         if intersections.is_empty:
             return poi
 
-        valid_geom_types = ['Point', 'MultiPoint', 'LineString']
-        if intersections.geom_type in valid_geom_types:
+        if intersections.geom_type in NEAREST_POINT_GEOM_TYPES:
             nearest_pts = nearest_points(Point(poi), intersections)
             return tuple(map(int, nearest_pts[1].coords[0]))
 
@@ -0,0 +1,18 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+DATA_DIR = Path(__file__).parent / 'data'
+
+
+@pytest.fixture
+def page_xml(tmp_path) -> Path:
+    """ Copy of a PAGE XML file with two text regions in reversed reading order and a line without text. """
+    return Path(shutil.copy(DATA_DIR / 'page.xml', tmp_path / 'page.xml'))
+
+
+@pytest.fixture
+def table_xml(tmp_path) -> Path:
+    """ Copy of a PAGE XML file with a single table region of two cells. """
+    return Path(shutil.copy(DATA_DIR / 'table.xml', tmp_path / 'table.xml'))
@@ -0,0 +1,49 @@
+import csv
+
+from typer.testing import CliRunner
+
+from pageplus.main import app
+
+runner = CliRunner()
+
+
+def test_dsv_skips_lines_without_text(page_xml):
+    result = runner.invoke(app, ['export', 'dsv', str(page_xml)])
+    assert result.exit_code == 0, result.output
+    with open(page_xml.parent / 'TSV' / 'page.tsv') as tsvfile:
+        rows = list(csv.DictReader(tsvfile, delimiter='\t'))
+    assert [(row['id'], row['text']) for row in rows] == [('l1', 'First region'), ('l3', 'Second region')]
+
+
+def test_dsv_outputdir_writes_tsv_files(page_xml, tmp_path):
+    outputdir = tmp_path / 'out'
+    result = runner.invoke(app, ['export', 'dsv', '--outputdir', str(outputdir), str(page_xml)])
+    assert result.exit_code == 0, result.output
+    assert [path.name for path in outputdir.iterdir()] == ['page.tsv']
+
+
+def test_delete_text_line_level_on_table_page(table_xml, tmp_path):
+    outputdir = tmp_path / 'out'
+    result = runner.invoke(app, ['modification', 'delete-text', '--level', 'line',
+                                 '--outputdir', str(outputdir), str(table_xml)])
+    assert result.exit_code == 0, result.output
+    assert b'TextEquiv' not in (outputdir / 'table.xml').read_bytes()
+
+
+def test_statistics_jobs_match_sequential_totals(page_xml, table_xml, caplog):
+    def totals(jobs):
+        caplog.clear()
+        result = runner.invoke(app, ['analytics', 'statistics', '--jobs', str(jobs), str(page_xml.parent)])
+        assert result.exit_code == 0, result.output
+        return [record.getMessage() for record in caplog.records
+                if record.getMessage().startswith('Statistics for all')]
+
+    caplog.set_level('INFO')
+    sequential = totals(1)
+    assert sequential == ['Statistics for all 2 PAGE-XML\n'
+                          'Overall textregions:  2\n'
+                          'Overall tableregions: 1\n'
+                          'Overall lines:        5\n'
+                          'Overall words:        7\n'
+                          'Overall glyphs:       36']
+    assert totals(2) == sequential
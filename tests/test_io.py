@@ -0,0 +1,22 @@
+import shutil
+from pathlib import Path
+
+from pageplus.io.utils import _scan_xml_files, collect_xml_files
+
+
+def test_scan_xml_files_matches_rglob(page_xml, tmp_path):
+    root = tmp_path / 'pages'
+    nested = root / 'a' / 'b'
+    nested.mkdir(parents=True)
+    shutil.copy(page_xml, nested / 'nested.xml')
+    # A directory named like an XML file, a symlink loop and a symlinked directory
+    (root / 'x.xml').mkdir()
+    (root / 'a' / 'loop').symlink_to('..', target_is_directory=True)
+    outside = tmp_path / 'outside'
+    outside.mkdir()
+    shutil.copy(page_xml, outside / 'linked.xml')
+    (root / 'linked').symlink_to(outside, target_is_directory=True)
+
+    rglob_files = sorted(path for path in root.rglob('*.xml') if path.is_file())
+    assert sorted(_scan_xml_files(root)) == rglob_files
+    assert collect_xml_files([root]) == [nested / 'nested.xml']
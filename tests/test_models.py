@@ -0,0 +1,19 @@
+from pageplus.models.page import Page
+
+
+def test_extract_fulltext_reading_order_keeps_all_regions(page_xml):
+    page = Page(page_xml)
+    assert page.extract_fulltext(reading_order=True) == 'Second region\nFirst region'
+
+
+def test_delete_lines_on_table_page(table_xml):
+    page = Page(table_xml)
+    page.delete_textlevel('line')
+    assert not page.root.findall(f'.//{{{page.ns}}}TextLine/{{{page.ns}}}TextEquiv')
+
+
+def test_tableregion_textlines_follow_cells(table_xml):
+    tableregion = Page(table_xml).regions.tableregions[0]
+    assert [line.get_id() for line in tableregion.textlines] == ['tl1', 'tl2']
+    tableregion.tablecells[0].delete_textlines([0])
+    assert [line.get_id() for line in tableregion.textlines] == ['tl2']